@@ -2,19 +2,28 @@
 Example usage of the pyvenice Venice.ai API client library.
 """
 
+import asyncio
 import os
 import sys
+from functools import lru_cache, partial
 from pathlib import Path
 
 # Add the parent directory to Python path to find the pyvenice package
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from pyvenice import VeniceClient, ChatCompletion, ImageGeneration, Models
+from image_utils import write_base64_image
 
 # Initialize client - requires VENICE_API_KEY environment variable
 client = VeniceClient()
 
 
+@lru_cache(maxsize=None)
+def get_text_models():
+    """Fetch the text model list once and reuse it on later calls."""
+    return Models(client).list(type="text")
+
+
 def example_chat():
     """Example of using chat completions."""
     chat = ChatCompletion(client)
@@ -45,7 +54,7 @@ def example_models():
     models = Models(client)
 
     # List all text models
-    text_models = models.list(type="text")
+    text_models = get_text_models()
     print("\nAvailable Text Models:")
     for model in text_models.data[:5]:  # Show first 5
         print(f"- {model.id}: {model.model_spec.description}")
@@ -82,38 +91,49 @@ def example_image_generation():
 
     # Save image to file (base64 decoded)
     if response.images:
-        import base64
-
-        image_data = base64.b64decode(response.images[0])
-        with open("generated_image.webp", "wb") as f:
-            f.write(image_data)
+        write_base64_image(response.images[0], "generated_image.webp")
         print("Image saved as generated_image.webp")
 
 
-def multiple_images():
+async def multiple_images(max_concurrency: int = 4):
+    """Generate one image per style, running requests concurrently."""
     image_gen = ImageGeneration(client)
 
     styles = image_gen.list_styles()
-
-    for style in styles:
-        response = image_gen.generate(
-            prompt="A flying sorceress wearing translucent-azure arcane robes in a desert setting",
-            model="hidream",
-            style_preset=style,
-            width=1024,
-            height=1024,
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    loop = asyncio.get_running_loop()
+
+    async def generate(style):
+        async with semaphore:
+            response = await loop.run_in_executor(
+                None,
+                partial(
+                    image_gen.generate,
+                    prompt="A flying sorceress wearing translucent-azure arcane robes in a desert setting",
+                    model="hidream",
+                    style_preset=style,
+                    width=1024,
+                    height=1024,
+                ),
+            )
+
+        image_gen.save_images(
+            response,
+            output_dir="outputs",
+            filename_template=f"{style}_{{index}}_{{timestamp}}",
+            format="png",
         )
 
-        image_gen.save_images(response, output_dir="outputs", format="png")
+    await asyncio.gather(*(generate(style) for style in styles))
 
 
-#        if response.images:
-#            import base64
-#
-#            image_data = base64.b64decode(response.images[0])
-#            with open(f"image_{style}.webp", "wb") as f:
-#                f.write(image_data)
-#            print(f"image_{style}.webp generated.")
+async def run_async_examples():
+    """Run the async examples and close the async client on the same loop."""
+    try:
+        await multiple_images()
+    finally:
+        await client.close_async()
 
 
 def example_streaming():
@@ -142,7 +162,7 @@ if __name__ == "__main__":
     print("=== Venice.ai API Examples ===\n")
 
     try:
-        multiple_images()
+        asyncio.run(run_async_examples())
     except Exception as e:
         print(f"\nError: {e}")
     finally:
@@ -0,0 +1,22 @@
+"""
+Helpers shared by the pyvenice example scripts.
+"""
+
+import binascii
+import re
+
+# Characters outside the base64 alphabet are discarded, like base64.b64decode
+_NON_BASE64 = re.compile(r"[^A-Za-z0-9+/=]")
+
+
+def write_base64_image(image_b64: str, path: str, chunk_size: int = 65536):
+    """Decode base64 image data straight to disk in fixed-size chunks."""
+    if chunk_size < 4:
+        raise ValueError("chunk_size must be at least 4")
+
+    image_b64 = _NON_BASE64.sub("", image_b64)
+    # Each chunk must be a multiple of 4 characters to decode on its own
+    chunk_size -= chunk_size % 4
+    with open(path, "wb") as f:
+        for start in range(0, len(image_b64), chunk_size):
+            f.write(binascii.a2b_base64(image_b64[start : start + chunk_size]))
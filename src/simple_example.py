@@ -3,34 +3,47 @@
 Simple example showing how to use the pyvenice library.
 """
 
+import asyncio
 import os
+from functools import partial
 from pyvenice import VeniceClient, ChatCompletion, Models, ImageGeneration
+from image_utils import write_base64_image
 
 
-def multiple_images():
-    """Generate multiple images using different styles."""
+async def multiple_images(max_concurrency: int = 4):
+    """Generate multiple images using different styles, concurrently."""
     client = VeniceClient()
     image_gen = ImageGeneration(client)
 
     styles = image_gen.list_styles()
-
-    for style in styles:
-        response = image_gen.generate(
-            prompt="A battle-scarred veteran soldier wearing a suit of nanotech body armour in a desert setting",
-            model="flux-dev",
-            style_preset=style,
-            width=1024,
-            height=1024,
-        )
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    loop = asyncio.get_running_loop()
+
+    async def generate(style):
+        async with semaphore:
+            response = await loop.run_in_executor(
+                None,
+                partial(
+                    image_gen.generate,
+                    prompt="A battle-scarred veteran soldier wearing a suit of nanotech body armour in a desert setting",
+                    model="flux-dev",
+                    style_preset=style,
+                    width=1024,
+                    height=1024,
+                ),
+            )
 
         if response.images:
-            import base64
-
-            image_data = base64.b64decode(response.images[0])
-            with open(f"image_{style}.webp", "wb") as f:
-                f.write(image_data)
+            write_base64_image(response.images[0], f"image_{style}.webp")
             print(f"image_{style}.webp generated.")
 
+    try:
+        await asyncio.gather(*(generate(style) for style in styles))
+    finally:
+        client.close()
+        await client.close_async()
+
 
 def main():
     # Check for API key
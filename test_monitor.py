@@ -4,6 +4,11 @@ import asyncio
 import sys
 from pathlib import Path
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Add the scripts directory to path so we can import
 sys.path.insert(0, str(Path(__file__).parent / "scripts"))
 
@@ -29,4 +34,6 @@ async def test():
         traceback.print_exc()
 
 if __name__ == "__main__":
-    asyncio.run(test())
\ No newline at end of file
+    loop_factory = uvloop.new_event_loop if uvloop else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(test())
\ No newline at end of file